@@ -4,17 +4,34 @@ Handles loading and validation of configuration parameters
 """
 
 import configparser
+import contextlib
 import os
+import shutil
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+# Parsed INI contents keyed by (path, mtime_ns, size) to skip re-parsing unchanged files
+_PARSE_CACHE: Dict[Tuple[str, int, int], Dict[str, Dict[str, str]]] = {}
+
+def _evict_parse_cache(path: str):
+    """Remove all cached parses for an absolute config file path"""
+    for key in [key for key in _PARSE_CACHE if key[0] == path]:
+        del _PARSE_CACHE[key]
 
 class Config:
     """Configuration manager for the Telegram Monitor application"""
     
+    # Fields checked by validate(); assigning any of them clears its memo
+    _VALIDATED_FIELDS = frozenset({
+        'api_id', 'api_hash', 'target_channel', 'comment_messages',
+        'comment_delay_min', 'comment_delay_max', 'max_comments_per_hour',
+    })
+    
     def __init__(self, config_file: str = "config.ini"):
         self.config_file = config_file
         self.logger = logging.getLogger(__name__)
-        self.config = configparser.ConfigParser()
+        # Parsed INI contents as plain dicts: {section: {option: value}}
+        self._raw: Dict[str, Dict[str, str]] = {}
         
         # Default configuration values
         self.api_id: Optional[int] = None
@@ -23,18 +40,36 @@ class Config:
         self.session_name: str = "telegram_monitor_session"
         self.session_string: Optional[str] = None
         self.target_channel: Optional[str] = None
+        self._channel_username: Optional[str] = None
         self.comment_messages: List[str] = []
         self.comment_delay_min: int = 5
         self.comment_delay_max: int = 15
         self.max_comments_per_hour: int = 10
         
+        # Memoized successful validate(), reset when a validated field changes
+        self._valid_cache: Optional[bool] = None
+        
         self._load_config()
     
+    def __setattr__(self, name, value):
+        """Invalidate the validate() memo when a validated field is reassigned"""
+        if name in self._VALIDATED_FIELDS:
+            object.__setattr__(self, '_valid_cache', None)
+        object.__setattr__(self, name, value)
+    
     def _load_config(self):
         """Load configuration from file and environment variables"""
         # Load from config file if it exists
         if os.path.exists(self.config_file):
-            self.config.read(self.config_file)
+            path = os.path.abspath(self.config_file)
+            st = os.stat(path)
+            key = (path, st.st_mtime_ns, st.st_size)
+            raw = _PARSE_CACHE.get(key)
+            if raw is None:
+                raw = self._parse_file(path)
+                _evict_parse_cache(path)
+                _PARSE_CACHE[key] = raw
+            self._raw = raw
             self._load_from_file()
         else:
             self.logger.warning(f"Config file {self.config_file} not found, using environment variables and defaults")
@@ -46,56 +81,80 @@ class Config:
         if not self.api_id or not self.api_hash:
             self._interactive_config()
     
+    def _parse_file(self, path: str) -> Dict[str, Dict[str, str]]:
+        """Parse an INI file into plain dicts: {section: {option: value}}"""
+        parser = configparser.ConfigParser()
+        parser.read(path)
+        raw = {}
+        for section in parser.sections():
+            try:
+                raw[section] = dict(parser.items(section))
+            except configparser.InterpolationError as e:
+                # A lone '%' in a hand-written value; fall back to the literal text
+                self.logger.warning(f"Reading config section [{section}] without interpolation: {e}")
+                raw[section] = dict(parser.items(section, raw=True))
+        return raw
+    
     def _load_from_file(self):
         """Load configuration from INI file"""
         try:
             # API Configuration
-            if self.config.has_section('api'):
-                self.api_id = self.config.getint('api', 'api_id', fallback=None)
-                self.api_hash = self.config.get('api', 'api_hash', fallback=None)
-                self.phone_number = self.config.get('api', 'phone_number', fallback=None)
-                self.session_name = self.config.get('api', 'session_name', fallback=self.session_name)
+            api = self._raw.get('api')
+            if api is not None:
+                api_id = api.get('api_id')
+                self.api_id = int(api_id) if api_id is not None else None
+                self.api_hash = api.get('api_hash')
+                self.phone_number = api.get('phone_number')
+                self.session_name = api.get('session_name', self.session_name)
             
             # Monitor Configuration
-            if self.config.has_section('monitor'):
-                self.target_channel = self.config.get('monitor', 'target_channel', fallback=None)
+            monitor = self._raw.get('monitor')
+            if monitor is not None:
+                self._set_target_channel(monitor.get('target_channel'))
                 
                 # Load comment messages
-                messages_str = self.config.get('monitor', 'comment_messages', fallback='')
+                messages_str = monitor.get('comment_messages', '')
                 if messages_str:
                     self.comment_messages = [msg.strip() for msg in messages_str.split('|') if msg.strip()]
                 
-                self.comment_delay_min = self.config.getint('monitor', 'comment_delay_min', fallback=self.comment_delay_min)
-                self.comment_delay_max = self.config.getint('monitor', 'comment_delay_max', fallback=self.comment_delay_max)
-                self.max_comments_per_hour = self.config.getint('monitor', 'max_comments_per_hour', fallback=self.max_comments_per_hour)
+                self.comment_delay_min = int(monitor.get('comment_delay_min', self.comment_delay_min))
+                self.comment_delay_max = int(monitor.get('comment_delay_max', self.comment_delay_max))
+                self.max_comments_per_hour = int(monitor.get('max_comments_per_hour', self.max_comments_per_hour))
                 
         except Exception as e:
             self.logger.error(f"Error loading config file: {e}")
     
     def _load_from_env(self):
         """Load configuration from environment variables"""
+        get = os.environ.get
+        
         # API credentials from environment
-        if os.getenv('TELEGRAM_API_ID'):
+        api_id = get('TELEGRAM_API_ID')
+        if api_id:
             try:
-                self.api_id = int(os.getenv('TELEGRAM_API_ID'))
+                self.api_id = int(api_id)
             except ValueError:
                 self.logger.error("Invalid TELEGRAM_API_ID in environment")
         
-        if os.getenv('TELEGRAM_API_HASH'):
-            self.api_hash = os.getenv('TELEGRAM_API_HASH')
+        api_hash = get('TELEGRAM_API_HASH')
+        if api_hash:
+            self.api_hash = api_hash
         
-        if os.getenv('TELEGRAM_PHONE'):
-            self.phone_number = os.getenv('TELEGRAM_PHONE')
+        phone = get('TELEGRAM_PHONE')
+        if phone:
+            self.phone_number = phone
         
-        if os.getenv('TARGET_CHANNEL'):
-            self.target_channel = os.getenv('TARGET_CHANNEL')
+        target_channel = get('TARGET_CHANNEL')
+        if target_channel:
+            self._set_target_channel(target_channel)
         
-        if os.getenv('COMMENT_MESSAGES'):
-            messages = os.getenv('COMMENT_MESSAGES')
+        messages = get('COMMENT_MESSAGES')
+        if messages:
             self.comment_messages = [msg.strip() for msg in messages.split('|') if msg.strip()]
         
-        if os.getenv('TELEGRAM_SESSION'):
-            self.session_string = os.getenv('TELEGRAM_SESSION')
+        session = get('TELEGRAM_SESSION')
+        if session:
+            self.session_string = session
     
     def _interactive_config(self):
         """Interactive configuration for missing required values"""
@@ -117,7 +176,7 @@ class Config:
             self.phone_number = input("Enter your phone number (with country code, e.g., +1234567890): ").strip()
         
         if not self.target_channel:
-            self.target_channel = input("Enter target channel username (without @): ").strip()
+            self._set_target_channel(input("Enter target channel username (without @): ").strip())
         
         if not self.comment_messages:
             print("\nEnter comment messages (one per line, empty line to finish):")
@@ -138,40 +197,63 @@ class Config:
     
     def _save_config(self):
         """Save current configuration to file"""
+        self._valid_cache = None
+        tmp_file = self.config_file + '.tmp'
         try:
-            # Create config sections
-            if not self.config.has_section('api'):
-                self.config.add_section('api')
-            if not self.config.has_section('monitor'):
-                self.config.add_section('monitor')
+            # Start from the parsed file so unknown sections and options are kept
+            sections = {name: dict(options) for name, options in self._raw.items()}
             
             # API section
-            self.config.set('api', 'api_id', str(self.api_id))
-            self.config.set('api', 'api_hash', self.api_hash)
+            api = sections.setdefault('api', {})
+            api['api_id'] = str(self.api_id)
+            api['api_hash'] = self.api_hash
             if self.phone_number:
-                self.config.set('api', 'phone_number', self.phone_number)
-            self.config.set('api', 'session_name', self.session_name)
+                api['phone_number'] = self.phone_number
+            api['session_name'] = self.session_name
             
             # Monitor section
+            monitor = sections.setdefault('monitor', {})
             if self.target_channel:
-                self.config.set('monitor', 'target_channel', self.target_channel)
+                monitor['target_channel'] = self.target_channel
             if self.comment_messages:
-                self.config.set('monitor', 'comment_messages', ' | '.join(self.comment_messages))
-            self.config.set('monitor', 'comment_delay_min', str(self.comment_delay_min))
-            self.config.set('monitor', 'comment_delay_max', str(self.comment_delay_max))
-            self.config.set('monitor', 'max_comments_per_hour', str(self.max_comments_per_hour))
+                monitor['comment_messages'] = ' | '.join(self.comment_messages)
+            monitor['comment_delay_min'] = str(self.comment_delay_min)
+            monitor['comment_delay_max'] = str(self.comment_delay_max)
+            monitor['max_comments_per_hour'] = str(self.max_comments_per_hour)
+            
+            # Escape '%' so values read back unchanged through interpolation
+            data = ''.join(
+                f"[{name}]\n"
+                + ''.join(f"{option} = {str(value).replace('%', '%%')}\n" for option, value in options.items())
+                + "\n"
+                for name, options in sections.items()
+            )
+            
+            # Write to a temp file, then atomically swap it into place
+            with open(tmp_file, 'w', buffering=65536) as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            # Keep the original file's permissions (it holds the API hash)
+            if os.path.exists(self.config_file):
+                shutil.copymode(self.config_file, tmp_file)
+            os.replace(tmp_file, self.config_file)
             
-            # Write to file
-            with open(self.config_file, 'w') as f:
-                self.config.write(f)
+            # Drop cached parses of the previous file contents
+            _evict_parse_cache(os.path.abspath(self.config_file))
             
             self.logger.info(f"Configuration saved to {self.config_file}")
             
         except Exception as e:
             self.logger.error(f"Error saving config: {e}")
+            with contextlib.suppress(OSError):
+                os.remove(tmp_file)
     
     def validate(self) -> bool:
         """Validate configuration parameters"""
+        if self._valid_cache:
+            return True
+        
         errors = []
         
         if not self.api_id:
@@ -198,12 +280,18 @@ class Config:
         if errors:
             for error in errors:
                 self.logger.error(f"Configuration error: {error}")
-            return False
         
-        return True
+        self._valid_cache = not errors
+        return self._valid_cache
+    
+    def _set_target_channel(self, channel: Optional[str]):
+        """Set the target channel and cache its username without a leading @"""
+        self.target_channel = channel
+        if channel and channel.startswith('@'):
+            self._channel_username = channel[1:]
+        else:
+            self._channel_username = channel
     
-    def get_channel_username(self) -> str:
+    def get_channel_username(self) -> Optional[str]:
         """Get formatted channel username"""
-        if self.target_channel.startswith('@'):
-            return self.target_channel[1:]
-        return self.target_channel
+        return self._channel_username
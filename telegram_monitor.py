@@ -4,10 +4,12 @@ Main monitoring and commenting functionality using Telethon
 """
 
 import asyncio
+import contextlib
 import logging
 import random
 import time
-from typing import Optional, Set
+from collections import OrderedDict
+from typing import Optional
 from telethon import TelegramClient, events
 from telethon.sessions import StringSession
 from telethon.errors import (
@@ -32,8 +34,20 @@ class TelegramMonitor:
             max_actions=config.max_comments_per_hour,
             time_window=3600  # 1 hour in seconds
         )
-        self.processed_messages: Set[int] = set()
+        # Bounded record of handled message IDs (oldest evicted first)
+        self._processed: "OrderedDict[int, None]" = OrderedDict()
+        self._processed_cap = 10000
         self.target_entity = None
+        self._rng = random.Random()
+        self._randint = self._rng.randint
+        self._choice = self._rng.choice
+        self._messages = tuple(config.comment_messages)
+        self._delay_min = config.comment_delay_min
+        self._delay_max = config.comment_delay_max
+        self._stale_seconds = 300
+        self._my_id: Optional[int] = None
+        # Pending (message, delay) pairs consumed by a single comment worker
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=64)
         self.is_running = False
     
     async def start(self):
@@ -93,6 +107,7 @@ class TelegramMonitor:
             
             # Get user info
             me = await self.client.get_me()
+            self._my_id = me.id
             self.logger.info(f"Authenticated as: {me.first_name} (@{me.username})")
             
         except AuthKeyUnregisteredError:
@@ -144,6 +159,8 @@ class TelegramMonitor:
         async def handle_new_message(event):
             await self._handle_new_message(event)
         
+        worker = asyncio.create_task(self._comment_worker())
+        
         try:
             # Keep the client running
             self.logger.info("Monitor is now active. Waiting for new messages...")
@@ -155,6 +172,12 @@ class TelegramMonitor:
             raise
         finally:
             self.is_running = False
+            worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+            dropped = self._queue.qsize()
+            if dropped:
+                self.logger.warning(f"Dropped {dropped} queued comment(s) on shutdown")
     
     async def _handle_new_message(self, event):
         """Handle new message events"""
@@ -162,16 +185,18 @@ class TelegramMonitor:
             message = event.message
             
             # Skip if we've already processed this message
-            if message.id in self.processed_messages:
+            if message.id in self._processed:
+                self._processed.move_to_end(message.id)
                 return
             
             # Skip if message is from ourselves
-            if message.sender_id == (await self.client.get_me()).id:
+            if message.sender_id == self._my_id:
                 return
             
             # Skip if message is older than 5 minutes (to avoid commenting on old messages on startup)
-            if message.date.timestamp() < (time.time() - 300):
-                self.processed_messages.add(message.id)
+            now = time.time()
+            if message.date.timestamp() < now - self._stale_seconds:
+                self._mark_processed(message.id)
                 return
             
             self.logger.info(f"New message detected: ID {message.id}")
@@ -179,29 +204,49 @@ class TelegramMonitor:
             # Check rate limits
             if not self.rate_limiter.can_perform_action():
                 self.logger.warning("Rate limit exceeded, skipping comment")
-                self.processed_messages.add(message.id)
+                self._mark_processed(message.id)
                 return
             
-            # Add delay before commenting to appear more natural
-            delay = random.randint(self.config.comment_delay_min, self.config.comment_delay_max)
-            self.logger.info(f"Waiting {delay} seconds before commenting...")
-            await asyncio.sleep(delay)
-            
-            # Post comment
-            await self._post_comment(message)
+            # Queue the comment with a delay to appear more natural
+            delay = self._randint(self._delay_min, self._delay_max)
+            try:
+                self._queue.put_nowait((message, delay))
+            except asyncio.QueueFull:
+                self.logger.warning("Comment queue is full, skipping comment")
+                self._mark_processed(message.id)
+                return
             
-            # Mark as processed
-            self.processed_messages.add(message.id)
+            # Mark as processed and reserve the rate-limit slot up front
+            self._mark_processed(message.id)
             self.rate_limiter.record_action()
             
         except Exception as e:
             self.logger.error(f"Error handling new message: {e}")
     
+    async def _comment_worker(self):
+        """Post queued comments one at a time after their delay"""
+        while True:
+            message, delay = await self._queue.get()
+            try:
+                self.logger.info(f"Waiting {delay} seconds before commenting...")
+                await asyncio.sleep(delay)
+                await self._post_comment(message)
+            except Exception as e:
+                self.logger.error(f"Error in comment worker: {e}")
+            finally:
+                self._queue.task_done()
+    
+    def _mark_processed(self, message_id: int):
+        """Remember a handled message ID, evicting the oldest past the cap"""
+        self._processed[message_id] = None
+        if len(self._processed) > self._processed_cap:
+            self._processed.popitem(last=False)
+    
     async def _post_comment(self, original_message):
         """Post a comment reply to the original message"""
         try:
             # Select comment message
-            comment_text = random.choice(self.config.comment_messages)
+            comment_text = self._choice(self._messages)
             
             # Send reply to the message thread/comments
             await self.client.send_message(